@@ -0,0 +1,150 @@
+/**
+ * Smart Router - Capability Keyword Matching
+ * ===========================================
+ *
+ * Keyword tables and the matcher that infers capabilities from plugin,
+ * skill, agent, command and MCP descriptions. Shared by the registry
+ * builder and the keyword checks.
+ *
+ * @module scripts/capability-keywords
+ */
+// ============================================================================
+// Configuration
+// ============================================================================
+/**
+ * Capability keywords mapping
+ *
+ * Maps capability names to arrays of keywords that indicate that capability.
+ * When a plugin's description contains any of these keywords, it will be
+ * registered under that capability.
+ *
+ * To add new capabilities:
+ * 1. Add a new key with a descriptive capability name
+ * 2. Add an array of 3-5 specific keywords that strongly indicate that capability
+ * 3. Prefer multi-word phrases over single words to reduce false positives
+ *
+ * Keywords listed in WORD_START_KEYWORDS only match at the start of a word,
+ * so 'ui' matches "UI kit" but not "build". All other keywords match anywhere,
+ * so 'sql' still matches "mysql".
+ *
+ * After changing keywords, bump REGISTRY_VERSION in registry-builder.js so
+ * cached registries are rebuilt with the new matching.
+ */
+const CAPABILITY_KEYWORDS = {
+    'code-review': ['code review', 'review code', 'pr review', 'pull request review', 'code quality'],
+    'brainstorming': ['brainstorm', 'design', 'ideation', 'planning', 'architecture'],
+    'testing': ['test', 'testing', 'qa', 'quality assurance', 'test generation'],
+    'debugging': ['debug', 'troubleshoot', 'fix', 'hotfix', 'error', 'bug'],
+    'refactoring': ['refactor', 'cleanup', 'code organization', 'restructure'],
+    'documentation': ['docs', 'documentation', 'readme', 'api docs'],
+    'database': ['database', 'sql', 'query', 'migration', 'schema'],
+    'deployment': ['deploy', 'deployment', 'ci', 'cd', 'release'],
+    'security': ['security', 'auth', 'authentication', 'authorization', 'vulnerability'],
+    'performance': ['performance', 'optimization', 'speed', 'profiling'],
+    'git': ['git', 'version control', 'commit', 'merge', 'branch'],
+    'game-development': ['game', 'game dev', 'unity', 'unreal', 'godot'],
+    'backend-development': ['backend', 'api', 'openapi', 'server', 'microservice'],
+    'frontend-development': ['frontend', 'ui', 'react', 'component', 'styling'],
+    'conversation-search': ['memory', 'search conversations', 'episodic', 'history'],
+};
+/**
+ * Short keywords that commonly appear inside unrelated words ('ui' in "build",
+ * 'api' in "capital", 'fix' in "prefix"). They only match at the start of a
+ * word; compounds worth keeping ('openapi', 'hotfix') are listed as keywords
+ * of their own above. 'gui' is deliberately not one, since it would also
+ * match "guide".
+ */
+const WORD_START_KEYWORDS = new Set(['ui', 'ci', 'cd', 'qa', 'fix', 'api']);
+/**
+ * Aho-Corasick automaton over every capability keyword
+ *
+ * Built once at load time so inferCapability() can find all keywords in a
+ * single pass over the text instead of one substring search per keyword.
+ */
+const KEYWORD_AUTOMATON = buildKeywordAutomaton(CAPABILITY_KEYWORDS);
+// ============================================================================
+// Matching
+// ============================================================================
+/**
+ * Build an Aho-Corasick automaton from a capability -> keywords mapping
+ *
+ * Each state holds its goto transitions (keyed by lowercase ASCII char code),
+ * a failure link, and the [capability, keywordLength, wordStartOnly] entries
+ * for keywords ending at that state (including those reached via failure links).
+ */
+function buildKeywordAutomaton(keywordMap) {
+    const transitions = [new Map()];
+    const failure = [0];
+    const outputs = [[]];
+    for (const [capability, keywords] of Object.entries(keywordMap)) {
+        for (const keyword of keywords) {
+            let state = 0;
+            for (let i = 0; i < keyword.length; i++) {
+                const ch = keyword.charCodeAt(i);
+                let next = transitions[state].get(ch);
+                if (next === undefined) {
+                    next = transitions.length;
+                    transitions.push(new Map());
+                    failure.push(0);
+                    outputs.push([]);
+                    transitions[state].set(ch, next);
+                }
+                state = next;
+            }
+            outputs[state].push([capability, keyword.length, WORD_START_KEYWORDS.has(keyword)]);
+        }
+    }
+    // Breadth-first pass to compute failure links (root children fail to root)
+    const queue = [...transitions[0].values()];
+    for (let i = 0; i < queue.length; i++) {
+        const state = queue[i];
+        for (const [ch, next] of transitions[state]) {
+            queue.push(next);
+            let fallback = failure[state];
+            while (fallback !== 0 && !transitions[fallback].has(ch)) {
+                fallback = failure[fallback];
+            }
+            failure[next] = transitions[fallback].get(ch) ?? 0;
+            outputs[next] = outputs[next].concat(outputs[failure[next]]);
+        }
+    }
+    return { transitions, failure, outputs, order: Object.keys(keywordMap) };
+}
+/**
+ * Lowercase an ASCII char code; other code units are returned unchanged
+ */
+function foldCase(code) {
+    return code >= 65 && code <= 90 ? code + 32 : code;
+}
+/**
+ * Check whether a (case-folded) char code is an ASCII letter or digit
+ */
+function isWordChar(code) {
+    return (code >= 97 && code <= 122) || (code >= 48 && code <= 57);
+}
+/**
+ * Infer capabilities from text based on keyword matching
+ */
+export function inferCapability(text) {
+    const { transitions, failure, outputs, order } = KEYWORD_AUTOMATON;
+    const found = new Set();
+    let state = 0;
+    // Keywords are lowercase ASCII, so folding case per code unit while
+    // scanning avoids building a lowercased copy of the text first
+    for (let i = 0; i < text.length; i++) {
+        const ch = foldCase(text.charCodeAt(i));
+        while (state !== 0 && !transitions[state].has(ch)) {
+            state = failure[state];
+        }
+        state = transitions[state].get(ch) ?? 0;
+        for (const [capability, length, wordStartOnly] of outputs[state]) {
+            const start = i - length + 1;
+            if (wordStartOnly && start > 0 && isWordChar(foldCase(text.charCodeAt(start - 1)))) {
+                continue;
+            }
+            found.add(capability);
+        }
+    }
+    // Preserve CAPABILITY_KEYWORDS declaration order
+    return order.filter(capability => found.has(capability));
+}
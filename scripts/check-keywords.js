@@ -0,0 +1,38 @@
+#!/usr/bin/env node
+/**
+ * Smart Router - Keyword Matching Checks
+ * =======================================
+ *
+ * Pins down capability inference for keywords that are easy to get wrong:
+ * short keywords must not match inside unrelated words, while compound
+ * forms like "mysql" must keep their capability.
+ *
+ * Usage: node scripts/check-keywords.js
+ *
+ * @module scripts/check-keywords
+ */
+import assert from 'assert/strict';
+import { inferCapability } from './capability-keywords.js';
+const CASES = [
+    // Compound forms keep their capability
+    ['mysql', ['database']],
+    ['postgresql', ['database']],
+    ['nosql store', ['database']],
+    ['openapi', ['backend-development']],
+    ['hotfix', ['debugging']],
+    ['pytest', ['testing']],
+    // Short keywords don't match inside unrelated words
+    ['capital', []],
+    ['build', []],
+    ['prefix', []],
+    ['guides', []],
+    // Short keywords still match as words, in any case
+    ['UI kit', ['frontend-development']],
+    ['REST API', ['backend-development']],
+    ['x-api', ['backend-development']],
+    ['QA', ['testing']],
+];
+for (const [text, expected] of CASES) {
+    assert.deepEqual(inferCapability(text), expected, `inferCapability(${JSON.stringify(text)})`);
+}
+console.log(`✅ Smart Router: ${CASES.length} keyword checks passed`);
@@ -16,40 +16,34 @@ import { readFileSync, writeFileSync, existsSync, mkdirSync, readdirSync, statSy
 import { join, basename } from 'path';
 import { createHash } from 'crypto';
 import { homedir } from 'os';
+import { inferCapability } from './capability-keywords.js';
 // ============================================================================
 // Configuration
 // ============================================================================
-/** Maximum directory depth for local command scanning (prevents infinite recursion) */
-const MAX_SCAN_DEPTH = 10;
 /**
- * Capability keywords mapping
+ * Registry format version
  *
- * Maps capability names to arrays of keywords that indicate that capability.
- * When a plugin's description contains any of these keywords, it will be
- * registered under that capability.
- *
- * To add new capabilities:
- * 1. Add a new key with a descriptive capability name
- * 2. Add an array of 3-5 specific keywords that strongly indicate that capability
- * 3. Prefer multi-word phrases over single words to reduce false positives
+ * Mixed into the cache hash, so bumping it forces existing registries to be
+ * rebuilt. Bump it whenever the registry fields or keyword matching change.
  */
-const CAPABILITY_KEYWORDS = {
-    'code-review': ['code review', 'review code', 'pr review', 'pull request review', 'code quality'],
-    'brainstorming': ['brainstorm', 'design', 'ideation', 'planning', 'architecture'],
-    'testing': ['test', 'testing', 'qa', 'quality assurance', 'test generation'],
-    'debugging': ['debug', 'troubleshoot', 'fix', 'error', 'bug'],
-    'refactoring': ['refactor', 'cleanup', 'code organization', 'restructure'],
-    'documentation': ['docs', 'documentation', 'readme', 'api docs'],
-    'database': ['database', 'sql', 'query', 'migration', 'schema'],
-    'deployment': ['deploy', 'deployment', 'ci', 'cd', 'release'],
-    'security': ['security', 'auth', 'authentication', 'authorization', 'vulnerability'],
-    'performance': ['performance', 'optimization', 'speed', 'profiling'],
-    'git': ['git', 'version control', 'commit', 'merge', 'branch'],
-    'game-development': ['game', 'game dev', 'unity', 'unreal', 'godot'],
-    'backend-development': ['backend', 'api', 'server', 'microservice'],
-    'frontend-development': ['frontend', 'ui', 'react', 'component', 'styling'],
-    'conversation-search': ['memory', 'search conversations', 'episodic', 'history'],
-};
+const REGISTRY_VERSION = '1.1';
+/** Maximum directory depth for local command scanning (prevents infinite recursion) */
+const MAX_SCAN_DEPTH = 10;
+/** Project and home roots, resolved once at startup */
+const PROJECT_DIR = process.env.CLAUDE_PROJECT_DIR || process.cwd();
+const HOME_DIR = homedir();
+/** Paths read or written by the builder, joined once instead of per use */
+const CACHE_DIR = join(PROJECT_DIR, '.claude', '.cache');
+const REGISTRY_PATH = join(CACHE_DIR, 'agent-registry.json');
+const HASH_PATH = join(CACHE_DIR, 'plugin-hash.txt');
+const GLOBAL_PLUGIN_DIR = join(HOME_DIR, '.claude', 'plugins', 'cache');
+const LOCAL_COMMAND_DIR = join(PROJECT_DIR, '.claude', 'commands');
+const CLAUDE_JSON_PATH = join(HOME_DIR, '.claude.json');
+const SETTINGS_PATH = join(HOME_DIR, '.claude', 'settings.json');
+/** Patterns used by extractDescription(), compiled once rather than per file */
+const FRONTMATTER_PATTERN = /^---\s*\n([\s\S]*?)\n---/;
+const DESCRIPTION_PATTERN = /description:\s*(.+)/;
+const QUOTES_PATTERN = /['"]/g;
 /**
  * MCP name to capability mapping
  *
@@ -159,13 +153,18 @@ const scanWarnings = [];
 // ============================================================================
 /**
  * Compute a hash of file modification times for cache invalidation
+ *
+ * The optional seed is hashed first, so changing it invalidates the cache
+ * even when no file has changed.
  */
-function computeHash(paths) {
+function computeHash(paths, seed = '') {
     const hash = createHash('sha256');
+    hash.update(seed);
     for (const path of paths.sort()) {
         try {
-            if (existsSync(path)) {
-                const stat = statSync(path);
+            // Missing paths are skipped without a separate existsSync() stat
+            const stat = statSync(path, { throwIfNoEntry: false });
+            if (stat) {
                 hash.update(`${path}:${stat.mtimeMs}`);
             }
         }
@@ -176,6 +175,23 @@ function computeHash(paths) {
     }
     return hash.digest('hex');
 }
+/**
+ * Read a UTF-8 file, returning null if it doesn't exist
+ *
+ * Replaces an existsSync() + readFileSync() pair with a single open.
+ * Any other error is thrown to the caller.
+ */
+function readFileIfExists(path) {
+    try {
+        return readFileSync(path, 'utf-8');
+    }
+    catch (err) {
+        if (err.code === 'ENOENT' || err.code === 'ENOTDIR') {
+            return null;
+        }
+        throw err;
+    }
+}
 /**
  * Safely read a directory, returning empty array on error
  */
@@ -252,50 +268,34 @@ function scanPlugins(pluginDir) {
                     scanWarnings.push(`Skipping potential path traversal: ${versionPath}`);
                     continue;
                 }
-                if (existsSync(manifestPath)) {
-                    try {
-                        const content = readFileSync(manifestPath, 'utf-8');
-                        const manifest = JSON.parse(content);
-                        if (!manifest.name || typeof manifest.name !== 'string') {
-                            scanErrors.push({
-                                path: manifestPath,
-                                error: 'Invalid manifest: missing or invalid name field'
-                            });
-                            continue;
-                        }
-                        manifests.push({
-                            ...manifest,
-                            _path: versionPath
-                        });
-                    }
-                    catch (err) {
+                try {
+                    const content = readFileIfExists(manifestPath);
+                    if (content === null)
+                        continue;
+                    const manifest = JSON.parse(content);
+                    if (!manifest.name || typeof manifest.name !== 'string') {
                         scanErrors.push({
                             path: manifestPath,
-                            error: `Failed to parse: ${err instanceof Error ? err.message : String(err)}`
+                            error: 'Invalid manifest: missing or invalid name field'
                         });
+                        continue;
                     }
+                    manifests.push({
+                        ...manifest,
+                        _path: versionPath
+                    });
+                }
+                catch (err) {
+                    scanErrors.push({
+                        path: manifestPath,
+                        error: `Failed to parse: ${err instanceof Error ? err.message : String(err)}`
+                    });
                 }
             }
         }
     }
     return manifests;
 }
-/**
- * Infer capabilities from text based on keyword matching
- */
-function inferCapability(text) {
-    const capabilities = [];
-    const lowerText = text.toLowerCase();
-    for (const [capability, keywords] of Object.entries(CAPABILITY_KEYWORDS)) {
-        for (const keyword of keywords) {
-            if (lowerText.includes(keyword)) {
-                capabilities.push(capability);
-                break;
-            }
-        }
-    }
-    return capabilities;
-}
 /**
  * Extract description from a markdown file (YAML frontmatter or first line)
  */
@@ -303,11 +303,11 @@ function extractDescription(filePath) {
     try {
         const content = readFileSync(filePath, 'utf-8');
         // Try to extract from YAML frontmatter
-        const yamlMatch = content.match(/^---\s*\n([\s\S]*?)\n---/);
+        const yamlMatch = content.match(FRONTMATTER_PATTERN);
         if (yamlMatch) {
-            const descMatch = yamlMatch[1].match(/description:\s*(.+)/);
+            const descMatch = yamlMatch[1].match(DESCRIPTION_PATTERN);
             if (descMatch) {
-                return descMatch[1].trim().replace(/['"]/g, '');
+                return descMatch[1].trim().replace(QUOTES_PATTERN, '');
             }
         }
         // Fallback: first non-comment, non-frontmatter line
@@ -334,12 +334,11 @@ function extractDescription(filePath) {
  */
 function scanMCPs() {
     const mcps = [];
-    const claudeJsonPath = join(homedir(), '.claude.json');
-    if (!existsSync(claudeJsonPath)) {
-        return mcps;
-    }
     try {
-        const content = readFileSync(claudeJsonPath, 'utf-8');
+        const content = readFileIfExists(CLAUDE_JSON_PATH);
+        if (content === null) {
+            return mcps;
+        }
         const config = JSON.parse(content);
         const mcpServers = config.mcpServers || {};
         for (const [name, serverConfig] of Object.entries(mcpServers)) {
@@ -368,12 +367,41 @@ function scanMCPs() {
     }
     catch (err) {
         scanErrors.push({
-            path: claudeJsonPath,
+            path: CLAUDE_JSON_PATH,
             error: `Failed to parse MCP config: ${err instanceof Error ? err.message : String(err)}`
         });
     }
     return mcps;
 }
+/**
+ * Describe an MCP server provided by a plugin
+ *
+ * Uses known capabilities for the MCP (or its plugin) when available,
+ * otherwise infers them from the MCP name, plugin name and description.
+ */
+function describePluginMCP(mcpName, command, plugin) {
+    const knownMCP = MCP_CAPABILITY_MAP[mcpName] || MCP_CAPABILITY_MAP[plugin.name];
+    if (knownMCP) {
+        return {
+            name: mcpName,
+            command,
+            capabilities: knownMCP.capabilities,
+            description: knownMCP.description,
+            source: 'plugin',
+            providedBy: plugin.name
+        };
+    }
+    const pluginDesc = plugin.description || '';
+    const inferredCaps = inferCapability(`${mcpName} ${plugin.name} ${pluginDesc}`);
+    return {
+        name: mcpName,
+        command,
+        capabilities: inferredCaps.length > 0 ? inferredCaps : ['general'],
+        description: pluginDesc || `MCP server: ${mcpName} (from ${plugin.name})`,
+        source: 'plugin',
+        providedBy: plugin.name
+    };
+}
 /**
  * Scan MCP servers provided by plugins via plugin.json mcpServers field
  */
@@ -383,32 +411,7 @@ function scanPluginMCPsFromManifest(plugins) {
         if (!plugin.mcpServers)
             continue;
         for (const [mcpName, serverConfig] of Object.entries(plugin.mcpServers)) {
-            // Look up known MCP capabilities or infer from plugin description
-            const knownMCP = MCP_CAPABILITY_MAP[mcpName] || MCP_CAPABILITY_MAP[plugin.name];
-            const pluginDesc = plugin.description || '';
-            if (knownMCP) {
-                mcps.push({
-                    name: mcpName,
-                    command: serverConfig.command || 'unknown',
-                    capabilities: knownMCP.capabilities,
-                    description: knownMCP.description,
-                    source: 'plugin',
-                    providedBy: plugin.name
-                });
-            }
-            else {
-                // Infer capabilities from plugin name, MCP name, and description
-                const inferText = `${mcpName} ${plugin.name} ${pluginDesc}`;
-                const inferredCaps = inferCapability(inferText);
-                mcps.push({
-                    name: mcpName,
-                    command: serverConfig.command || 'unknown',
-                    capabilities: inferredCaps.length > 0 ? inferredCaps : ['general'],
-                    description: pluginDesc || `MCP server: ${mcpName} (from ${plugin.name})`,
-                    source: 'plugin',
-                    providedBy: plugin.name
-                });
-            }
+            mcps.push(describePluginMCP(mcpName, serverConfig.command || 'unknown', plugin));
         }
     }
     return mcps;
@@ -421,16 +424,13 @@ function scanPluginMCPsFromMcpJson(plugins) {
     const mcps = [];
     for (const plugin of plugins) {
         const mcpJsonPath = join(plugin._path, '.mcp.json');
-        if (!existsSync(mcpJsonPath))
-            continue;
         try {
-            const content = readFileSync(mcpJsonPath, 'utf-8');
+            const content = readFileIfExists(mcpJsonPath);
+            if (content === null)
+                continue;
             const mcpConfig = JSON.parse(content);
             for (const [mcpName, serverConfig] of Object.entries(mcpConfig)) {
                 const config = serverConfig;
-                // Look up known MCP capabilities or infer from plugin description
-                const knownMCP = MCP_CAPABILITY_MAP[mcpName] || MCP_CAPABILITY_MAP[plugin.name];
-                const pluginDesc = plugin.description || '';
                 // Determine command type (npx, uvx, http, sse)
                 let command = 'unknown';
                 if (config.command) {
@@ -439,29 +439,7 @@ function scanPluginMCPsFromMcpJson(plugins) {
                 else if (config.type === 'http' || config.type === 'sse') {
                     command = String(config.type);
                 }
-                if (knownMCP) {
-                    mcps.push({
-                        name: mcpName,
-                        command,
-                        capabilities: knownMCP.capabilities,
-                        description: knownMCP.description,
-                        source: 'plugin',
-                        providedBy: plugin.name
-                    });
-                }
-                else {
-                    // Infer capabilities from plugin name, MCP name, and description
-                    const inferText = `${mcpName} ${plugin.name} ${pluginDesc}`;
-                    const inferredCaps = inferCapability(inferText);
-                    mcps.push({
-                        name: mcpName,
-                        command,
-                        capabilities: inferredCaps.length > 0 ? inferredCaps : ['general'],
-                        description: pluginDesc || `MCP server: ${mcpName} (from ${plugin.name})`,
-                        source: 'plugin',
-                        providedBy: plugin.name
-                    });
-                }
+                mcps.push(describePluginMCP(mcpName, command, plugin));
             }
         }
         catch (err) {
@@ -475,12 +453,11 @@ function scanPluginMCPsFromMcpJson(plugins) {
  */
 function scanEnabledPlugins() {
     const enabled = [];
-    const settingsPath = join(homedir(), '.claude', 'settings.json');
-    if (!existsSync(settingsPath)) {
-        return enabled;
-    }
     try {
-        const content = readFileSync(settingsPath, 'utf-8');
+        const content = readFileIfExists(SETTINGS_PATH);
+        if (content === null) {
+            return enabled;
+        }
         const config = JSON.parse(content);
         const enabledPlugins = config.enabledPlugins || {};
         for (const [pluginName, isEnabled] of Object.entries(enabledPlugins)) {
@@ -491,28 +468,48 @@ function scanEnabledPlugins() {
     }
     catch (err) {
         scanErrors.push({
-            path: settingsPath,
+            path: SETTINGS_PATH,
             error: `Failed to parse settings: ${err instanceof Error ? err.message : String(err)}`
         });
     }
     return enabled;
 }
 /**
- * Build the complete capability registry
+ * Compute the cache invalidation hash for the scanned plugins
+ *
+ * Only stats plugin directories and config files, so it is cheap enough to
+ * run before deciding whether the registry needs rebuilding at all.
  */
-function buildRegistry() {
+function computeRegistryHash(plugins) {
+    // computeHash() skips paths that don't exist, so no existsSync() needed
+    const pluginPaths = plugins.map(p => p._path);
+    pluginPaths.push(LOCAL_COMMAND_DIR);
+    // Include MCP config in hash
+    pluginPaths.push(CLAUDE_JSON_PATH);
+    // Include the registry version so format changes trigger a rebuild
+    return computeHash(pluginPaths, `version:${REGISTRY_VERSION}`);
+}
+/**
+ * Register a tool under each of the given capabilities
+ */
+function addToCapabilities(registry, capabilities, tool) {
+    for (const cap of capabilities) {
+        if (!registry.capabilities[cap]) {
+            registry.capabilities[cap] = [];
+        }
+        registry.capabilities[cap].push(tool);
+    }
+}
+/**
+ * Build the complete capability registry from already-scanned plugins
+ */
+function buildRegistry(plugins, hash) {
     const registry = {
-        version: '1.0',
+        version: REGISTRY_VERSION,
         lastBuilt: new Date().toISOString(),
-        hash: '',
+        hash,
         capabilities: {}
     };
-    const projectDir = process.env.CLAUDE_PROJECT_DIR || process.cwd();
-    const homeDir = homedir();
-    const globalPluginDir = join(homeDir, '.claude', 'plugins', 'cache');
-    const localCommandDir = join(projectDir, '.claude', 'commands');
-    // Scan global plugins
-    const plugins = scanPlugins(globalPluginDir);
     for (const plugin of plugins) {
         const pluginPath = plugin._path;
         // Scan agents
@@ -523,18 +520,13 @@ function buildRegistry() {
                 const agentPath = join(agentsDir, agentFile);
                 const description = extractDescription(agentPath);
                 const capabilities = inferCapability(description + ' ' + (plugin.description || ''));
-                for (const cap of capabilities) {
-                    if (!registry.capabilities[cap]) {
-                        registry.capabilities[cap] = [];
-                    }
-                    registry.capabilities[cap].push({
-                        plugin: plugin.name,
-                        type: 'agent',
-                        entry: `agents/${agentFile}`,
-                        description,
-                        source: 'global'
-                    });
-                }
+                addToCapabilities(registry, capabilities, {
+                    plugin: plugin.name,
+                    type: 'agent',
+                    entry: `agents/${agentFile}`,
+                    description,
+                    source: 'global'
+                });
             }
         }
         // Scan skills
@@ -549,18 +541,13 @@ function buildRegistry() {
                 if (existsSync(skillFile)) {
                     const description = extractDescription(skillFile);
                     const capabilities = inferCapability(description + ' ' + (plugin.description || ''));
-                    for (const cap of capabilities) {
-                        if (!registry.capabilities[cap]) {
-                            registry.capabilities[cap] = [];
-                        }
-                        registry.capabilities[cap].push({
-                            plugin: plugin.name,
-                            type: 'skill',
-                            entry: `skills/${skillDir}/SKILL.md`,
-                            description,
-                            source: 'global'
-                        });
-                    }
+                    addToCapabilities(registry, capabilities, {
+                        plugin: plugin.name,
+                        type: 'skill',
+                        entry: `skills/${skillDir}/SKILL.md`,
+                        description,
+                        source: 'global'
+                    });
                 }
             }
         }
@@ -572,23 +559,18 @@ function buildRegistry() {
                 const commandPath = join(commandsDir, commandFile);
                 const description = extractDescription(commandPath);
                 const capabilities = inferCapability(description + ' ' + (plugin.description || ''));
-                for (const cap of capabilities) {
-                    if (!registry.capabilities[cap]) {
-                        registry.capabilities[cap] = [];
-                    }
-                    registry.capabilities[cap].push({
-                        plugin: plugin.name,
-                        type: 'command',
-                        entry: `commands/${commandFile}`,
-                        description,
-                        source: 'global'
-                    });
-                }
+                addToCapabilities(registry, capabilities, {
+                    plugin: plugin.name,
+                    type: 'command',
+                    entry: `commands/${commandFile}`,
+                    description,
+                    source: 'global'
+                });
             }
         }
     }
     // Scan local commands (e.g., BMAD workflows)
-    if (existsSync(localCommandDir)) {
+    if (existsSync(LOCAL_COMMAND_DIR)) {
         function scanLocalDir(dir, basePath = '', depth = 0) {
             if (depth > MAX_SCAN_DEPTH) {
                 scanWarnings.push(`Skipping deep directory (depth > ${MAX_SCAN_DEPTH}): ${dir}`);
@@ -609,18 +591,13 @@ function buildRegistry() {
                     else if (item.endsWith('.md')) {
                         const description = extractDescription(itemPath);
                         const capabilities = inferCapability(description + ' ' + basename(item));
-                        for (const cap of capabilities) {
-                            if (!registry.capabilities[cap]) {
-                                registry.capabilities[cap] = [];
-                            }
-                            registry.capabilities[cap].push({
-                                plugin: `local:${basePath.split('/')[0] || 'commands'}`,
-                                type: 'workflow',
-                                entry: join(basePath, item),
-                                description,
-                                source: 'local'
-                            });
-                        }
+                        addToCapabilities(registry, capabilities, {
+                            plugin: `local:${basePath.split('/')[0] || 'commands'}`,
+                            type: 'workflow',
+                            entry: join(basePath, item),
+                            description,
+                            source: 'local'
+                        });
                     }
                 }
                 catch (err) {
@@ -628,7 +605,7 @@ function buildRegistry() {
                 }
             }
         }
-        scanLocalDir(localCommandDir);
+        scanLocalDir(LOCAL_COMMAND_DIR);
     }
     // Scan MCPs from ~/.claude.json (global MCPs)
     const globalMCPs = scanMCPs();
@@ -649,32 +626,21 @@ function buildRegistry() {
     registry.mcps = allMCPs;
     // Also add MCPs to capabilities for unified lookup
     for (const mcp of allMCPs) {
-        for (const cap of mcp.capabilities) {
-            if (!registry.capabilities[cap]) {
-                registry.capabilities[cap] = [];
-            }
-            registry.capabilities[cap].push({
-                plugin: mcp.providedBy ? `plugin:${mcp.providedBy}:mcp:${mcp.name}` : `mcp:${mcp.name}`,
-                type: 'mcp',
-                entry: mcp.name,
-                description: mcp.description,
-                source: mcp.source === 'plugin' ? 'global' : 'global' // MCPs are always global-level
-            });
-        }
+        addToCapabilities(registry, mcp.capabilities, {
+            plugin: mcp.providedBy ? `plugin:${mcp.providedBy}:mcp:${mcp.name}` : `mcp:${mcp.name}`,
+            type: 'mcp',
+            entry: mcp.name,
+            description: mcp.description,
+            source: 'global' // MCPs are always global-level
+        });
     }
     // Scan enabled plugins from settings
     registry.enabledPlugins = scanEnabledPlugins();
-    // Compute hash for cache invalidation
-    const pluginPaths = plugins.map(p => p._path);
-    if (existsSync(localCommandDir)) {
-        pluginPaths.push(localCommandDir);
-    }
-    // Include MCP config in hash
-    const claudeJsonPath = join(homeDir, '.claude.json');
-    if (existsSync(claudeJsonPath)) {
-        pluginPaths.push(claudeJsonPath);
-    }
-    registry.hash = computeHash(pluginPaths);
+    // Precompute totals so readers don't have to walk every capability list
+    registry.stats = {
+        totalCapabilities: Object.keys(registry.capabilities).length,
+        totalTools: Object.values(registry.capabilities).reduce((sum, tools) => sum + tools.length, 0)
+    };
     return registry;
 }
 // ============================================================================
@@ -682,22 +648,17 @@ function buildRegistry() {
 // ============================================================================
 async function main() {
     try {
-        const projectDir = process.env.CLAUDE_PROJECT_DIR || process.cwd();
-        const cacheDir = join(projectDir, '.claude', '.cache');
-        const registryPath = join(cacheDir, 'agent-registry.json');
-        const hashPath = join(cacheDir, 'plugin-hash.txt');
-        // Ensure cache directory exists
-        if (!existsSync(cacheDir)) {
-            mkdirSync(cacheDir, { recursive: true });
-        }
-        // Build new registry
-        const newRegistry = buildRegistry();
+        // Ensure cache directory exists (recursive mkdir is a no-op if it does)
+        mkdirSync(CACHE_DIR, { recursive: true });
+        // Scan plugin manifests and hash them before extracting any capabilities
+        const plugins = scanPlugins(GLOBAL_PLUGIN_DIR);
+        const hash = computeRegistryHash(plugins);
         // Check if rebuild is needed
         let shouldRebuild = true;
-        if (existsSync(hashPath) && existsSync(registryPath)) {
+        if (existsSync(REGISTRY_PATH)) {
             try {
-                const oldHash = readFileSync(hashPath, 'utf-8').trim();
-                if (oldHash === newRegistry.hash) {
+                const oldHash = readFileIfExists(HASH_PATH)?.trim();
+                if (oldHash === hash) {
                     shouldRebuild = false;
                 }
             }
@@ -707,9 +668,11 @@ async function main() {
             }
         }
         if (shouldRebuild) {
+            // Only scan agents, skills, commands and MCPs when plugins changed
+            const newRegistry = buildRegistry(plugins, hash);
             // Write registry first
             try {
-                writeFileSync(registryPath, JSON.stringify(newRegistry, null, 2));
+                writeFileSync(REGISTRY_PATH, JSON.stringify(newRegistry, null, 2));
             }
             catch (err) {
                 console.error(`Smart Router: Failed to write registry: ${err}`);
@@ -717,17 +680,16 @@ async function main() {
             }
             // Then write hash
             try {
-                writeFileSync(hashPath, newRegistry.hash);
+                writeFileSync(HASH_PATH, newRegistry.hash);
             }
             catch (err) {
                 console.error(`Smart Router: Failed to write hash: ${err}`);
                 // Registry is already written, so this is a partial failure
             }
-            const capCount = Object.keys(newRegistry.capabilities).length;
-            const toolCount = Object.values(newRegistry.capabilities).reduce((sum, tools) => sum + tools.length, 0);
+            const { totalCapabilities, totalTools } = newRegistry.stats;
             const mcpCount = newRegistry.mcps?.length || 0;
             const pluginCount = newRegistry.enabledPlugins?.length || 0;
-            console.log(`✅ Smart Router: Registry built - ${capCount} capabilities, ${toolCount} tools, ${mcpCount} MCPs, ${pluginCount} enabled plugins`);
+            console.log(`✅ Smart Router: Registry built - ${totalCapabilities} capabilities, ${totalTools} tools, ${mcpCount} MCPs, ${pluginCount} enabled plugins`);
             // Report any errors/warnings that occurred during scan
             if (scanErrors.length > 0) {
                 console.warn(`⚠️  Smart Router: ${scanErrors.length} plugin(s) failed to load:`);